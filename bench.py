@@ -0,0 +1,174 @@
+"""Offline benchmarks for the catalog endpoints, the routine solver and the conflict checkers.
+
+    python bench.py
+    python bench.py --courses 600 --solver-courses 2,4,6,8,10 --repeat 200
+
+A synthetic feed from synthetic_data.py is written to a temporary directory
+and served by usis.py through the Flask test client; AI endpoints answer
+from a FakeLLMClient, so nothing touches the network. Every benchmark
+reports p50/p99/max latency over --repeat calls and the peak memory Python
+allocated during one call (tracemalloc); the process's peak RSS is printed
+at the end. Response caches are cleared before each call unless the name
+says "warm".
+"""
+import argparse
+import json
+import os
+import random
+import re
+import resource
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from synthetic_data import generate_sections
+
+def percentile(samples, q):
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, round(q * (len(ordered) - 1)))]
+
+def fake_llm_answer(prompt):
+    """The first candidate of every course for routine prompts, a fixed reply otherwise."""
+    match = re.search(r"grouped by course\):\n(.*)\n", prompt)
+    if match:
+        courses = json.loads(match.group(1))["courses"]
+        return json.dumps([rows[0]["id"] for rows in courses.values() if rows])
+    return "- Benchmark reply."
+
+class Bench:
+    """Runs and reports benchmarks; `setup` runs untimed before every call."""
+
+    def __init__(self, repeat, out=sys.stdout):
+        self.repeat = repeat
+        self.out = out
+        self.results = []
+        print(f"{'benchmark':<48} {'calls':>6} {'p50 ms':>9} {'p99 ms':>9} {'max ms':>9} {'peak KiB':>9}", file=out)
+
+    def run(self, name, call, setup=None, repeat=None):
+        samples = []
+        for _ in range(repeat or self.repeat):
+            if setup:
+                setup()
+            started = time.perf_counter()
+            call()
+            samples.append((time.perf_counter() - started) * 1000)
+        if setup:
+            setup()
+        tracemalloc.start()
+        call()
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        result = (name, len(samples), percentile(samples, 0.5), percentile(samples, 0.99), max(samples), peak / 1024)
+        self.results.append(result)
+        print(f"{result[0]:<48} {result[1]:>6} {result[2]:>9.2f} {result[3]:>9.2f} {result[4]:>9.2f} {result[5]:>9.0f}", file=self.out, flush=True)
+        return result
+
+def load_usis(sections, workdir):
+    """Import usis serving `sections`, and wait for the dataset."""
+    path = os.path.join(workdir, "connect.json")
+    with open(path, "w") as f:
+        json.dump(sections, f)
+    os.environ["USIS_DATA_PATH"] = path
+    os.environ["USIS_SNAPSHOT_PATH"] = os.path.join(workdir, "none.snapshot")
+    os.environ.setdefault("USIS_LOG_LEVEL", "WARNING")
+    import usis
+    usis.set_llm_client(usis.FakeLLMClient(fake_llm_answer))
+    usis.current_dataset()
+    return usis
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark usis.py on synthetic data, offline.")
+    parser.add_argument("--courses", type=int, default=300, help="courses in the synthetic feed")
+    parser.add_argument("--sections", type=int, default=6, help="average sections per course")
+    parser.add_argument("--lab-fraction", type=float, default=0.3)
+    parser.add_argument("--exam-dates", type=int, default=10)
+    parser.add_argument("--exam-clustering", type=float, default=0.2)
+    parser.add_argument("--solver-courses", default="2,4,6,8", help="comma-separated course counts per routine request")
+    parser.add_argument("--repeat", type=int, default=50, help="calls per benchmark")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    sections = generate_sections(
+        courses=args.courses, sections_per_course=args.sections, lab_fraction=args.lab_fraction,
+        exam_dates=args.exam_dates, exam_clustering=args.exam_clustering, seed=args.seed,
+    )
+    rng = random.Random(args.seed)
+    with tempfile.TemporaryDirectory() as workdir:
+        started = time.perf_counter()
+        usis = load_usis(sections, workdir)
+        dataset = usis.current_dataset()
+        print(f"{len(dataset.sections)} sections in {len(dataset.index['courses'])} courses, "
+              f"imported and loaded in {(time.perf_counter() - started) * 1000:.0f} ms, "
+              f"NumPy {'on' if dataset.conflicts is not None else 'off'}\n")
+        client = usis.create_app().test_client()
+        bench = Bench(args.repeat)
+
+        def get(url, expected=200):
+            def call():
+                response = client.get(url)
+                response.get_data()
+                assert response.status_code == expected, (url, response.status_code)
+            return call
+
+        def post(url, body, expected=200):
+            def call():
+                response = client.post(url, json=body)
+                response.get_data()
+                assert response.status_code == expected, (url, response.status_code, response.get_data(as_text=True)[:200])
+            return call
+
+        def clear_caches():
+            usis.catalog_cache.clear()
+            usis.routine_cache.clear()
+            usis.ai_cache.clear()
+
+        courses = list(dataset.index["courses"])
+        busiest = max(courses, key=lambda code: len(dataset.sections_for_course(code)))
+        exam_dates = sorted({exam.date for section in dataset.sections for exam in section.exams})
+        busiest_date = max(exam_dates, key=lambda date: len(dataset.exams.on_date(date)))
+
+        bench.run("build dataset", lambda: usis.build_dataset(json.loads(json.dumps(sections)), 0, "bench"), repeat=3)
+        for name, url in [
+            ("GET /api/courses", "/api/courses"),
+            (f"GET /api/course_details ({busiest})", f"/api/course_details?course={busiest}"),
+            ("GET /api/course_details rows", f"/api/course_details?course={busiest}&format=rows"),
+            ("GET /api/faculty", "/api/faculty"),
+            ("GET /api/faculty_for_courses (5 courses)", "/api/faculty_for_courses?courses=" + ",".join(courses[:5])),
+            (f"GET /api/exam_schedule?date={busiest_date}", f"/api/exam_schedule?date={busiest_date}"),
+        ]:
+            bench.run(name, get(url), setup=clear_caches)
+            bench.run(f"{name} warm", get(url))
+
+        for count in (int(n) for n in args.solver_courses.split(",") if n.strip()):
+            bodies = [
+                {"courses": [{"course": code, "faculty": []} for code in rng.sample(courses, min(count, len(courses)))],
+                 "days": usis.WEEKDAYS, "times": usis.TIME_SLOTS}
+                for _ in range(bench.repeat)
+            ]
+            for mode, extra in (("first", {}), ("topK=5", {"topK": 5}), ("AI (fake)", {"useAI": True})):
+                requests = iter(bodies * 2)
+                bench.run(f"POST /api/routine {count} courses, {mode}",
+                          lambda: post("/api/routine", {**next(requests), **extra})(), setup=clear_caches)
+
+        sample = rng.sample(dataset.sections, min(40, len(dataset.sections)))
+        bench.run("has_internal_conflicts, every section",
+                  lambda: [usis.has_internal_conflicts(section) for section in dataset.sections])
+        bench.run("sections_conflict, 40 sections pairwise",
+                  lambda: [usis.sections_conflict(a, b) for a in sample for b in sample])
+        bench.run("Dataset.sections_conflict, 40 sections pairwise",
+                  lambda: [dataset.sections_conflict(a, b) for a in sample for b in sample])
+        ids = [section.section_id for section in sample[:10]]
+        bench.run("GET /api/conflicts (10 sectionIds)", get("/api/conflicts?sectionIds=" + ",".join(ids)), setup=clear_caches)
+        bench.run("GET /api/conflicts (one sectionId)", get(f"/api/conflicts?sectionId={ids[0]}"), setup=clear_caches)
+        bench.run("GET /api/seats (10 sectionIds)", get("/api/seats?sectionIds=" + ",".join(ids)))
+        routine = [usis.section_routine_view(section) for section in sample[:6]]
+        bench.run("POST /api/check_time_conflicts_ai (6 sections)",
+                  post("/api/check_time_conflicts_ai", {"routine": routine}), setup=clear_caches)
+        bench.run("POST /api/check_exam_conflicts_ai (6 sections)",
+                  post("/api/check_exam_conflicts_ai", {"routine": routine}), setup=clear_caches)
+
+    print(f"\npeak RSS {resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024:.1f} MiB")
+
+if __name__ == "__main__":
+    main()
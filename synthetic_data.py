@@ -0,0 +1,110 @@
+"""Generate connect.json-shaped course data for benchmarks and local runs.
+
+    python synthetic_data.py --courses 400 --sections 8 -o connect.json
+    USIS_DATA_PATH=connect.json python usis.py
+
+Sections get two class meetings on a usual day pair in one of the frontend's
+TIME_SLOTS, an optional weekly lab, seat counts and mid/final exams. Exam
+clustering piles a share of the exams onto one date and time, which is what
+makes exam conflict checks expensive.
+"""
+import argparse
+import json
+import random
+import sys
+
+DAY_PAIRS = [("SUNDAY", "TUESDAY"), ("MONDAY", "WEDNESDAY"), ("SATURDAY", "MONDAY"), ("THURSDAY", "SUNDAY"), ("TUESDAY", "THURSDAY")]
+LAB_DAYS = ["SUNDAY", "MONDAY", "TUESDAY", "WEDNESDAY", "THURSDAY", "SATURDAY"]
+# TIME_SLOTS of usis.py in the feed's 24-hour format
+CLASS_TIMES = [("08:00:00", "09:20:00"), ("09:30:00", "10:50:00"), ("11:00:00", "12:20:00"), ("12:30:00", "13:50:00"),
+               ("14:00:00", "15:20:00"), ("15:30:00", "16:50:00"), ("17:00:00", "18:20:00")]
+LAB_TIMES = [("08:00:00", "10:50:00"), ("11:00:00", "13:50:00"), ("14:00:00", "16:50:00")]
+EXAM_TIMES = [("09:00:00", "11:00:00"), ("11:30:00", "13:30:00"), ("14:00:00", "16:00:00")]
+DEPARTMENTS = ["CSE", "EEE", "MAT", "PHY", "ENG", "BUS", "ECO", "CHE", "BIO", "ARC"]
+LETTERS = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+
+def exam_slot(rng, month, exam_dates, exam_clustering):
+    """(date, start, end) of one exam; clustered exams share the first date and time slot."""
+    if rng.random() < exam_clustering:
+        day, (start, end) = 0, EXAM_TIMES[0]
+    else:
+        day, (start, end) = rng.randrange(exam_dates), rng.choice(EXAM_TIMES)
+    return f"2024-{month:02d}-{1 + day:02d}", start, end
+
+def generate_sections(courses=200, sections_per_course=6, lab_fraction=0.3, exam_dates=10,
+                      exam_clustering=0.2, faculty=80, internal_conflicts=0.01, seed=0):
+    """A list of feed sections: `courses` courses with 1..2*`sections_per_course`-1 sections each
+    (`sections_per_course` on average). Labs go to `lab_fraction` of the courses, exams are
+    spread over `exam_dates` days (at most 28) with `exam_clustering` of them on one slot, and
+    `internal_conflicts` of the lab sections get a lab clashing with their own class."""
+    rng = random.Random(seed)
+    exam_dates = max(1, min(exam_dates, 28))
+    initials = sorted({"".join(rng.choice(LETTERS) for _ in range(3)) for _ in range(faculty)}) + ["TBA"]
+    sections = []
+    section_id = 100000
+    for c in range(courses):
+        code = f"{DEPARTMENTS[c % len(DEPARTMENTS)]}{101 + c // len(DEPARTMENTS)}"
+        has_lab = rng.random() < lab_fraction
+        for number in range(1, rng.randint(1, 2 * sections_per_course - 1) + 1):
+            section_id += 1
+            days = rng.choice(DAY_PAIRS)
+            start, end = rng.choice(CLASS_TIMES)
+            labs = []
+            if has_lab:
+                if rng.random() < internal_conflicts:
+                    # Lab on top of the section's own first class
+                    lab_day, lab_start, lab_end = days[0], start, end
+                else:
+                    lab_day, (lab_start, lab_end) = rng.choice(LAB_DAYS), rng.choice(LAB_TIMES)
+                labs.append({"day": lab_day, "startTime": lab_start, "endTime": lab_end, "room": f"{rng.randint(1, 9)}B-{rng.randint(1, 20):02d}L"})
+            capacity = rng.choice([30, 35, 40, 45])
+            mid_date, mid_start, mid_end = exam_slot(rng, 7, exam_dates, exam_clustering)
+            final_date, final_start, final_end = exam_slot(rng, 8, exam_dates, exam_clustering)
+            sections.append({
+                "sectionId": section_id,
+                "courseCode": code,
+                "courseName": f"{code} Synthetic Course",
+                "courseCredit": 3,
+                "sectionName": str(number),
+                "faculties": rng.choice(initials),
+                "capacity": capacity,
+                "consumedSeat": rng.randint(0, capacity),
+                "roomName": f"{rng.randint(1, 9)}B-{rng.randint(1, 20):02d}C",
+                "labRoomName": labs[0]["room"] if labs else None,
+                "sectionSchedule": {"classSchedules": [{"day": day, "startTime": start, "endTime": end} for day in days]},
+                "labSchedules": labs,
+                "midExamDate": mid_date,
+                "midExamStartTime": mid_start,
+                "midExamEndTime": mid_end,
+                "finalExamDate": final_date,
+                "finalExamStartTime": final_start,
+                "finalExamEndTime": final_end,
+            })
+    return sections
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Generate connect.json-shaped course data.")
+    parser.add_argument("-o", "--output", help="output file (default: stdout)")
+    parser.add_argument("--courses", type=int, default=200)
+    parser.add_argument("--sections", type=int, default=6, help="average sections per course")
+    parser.add_argument("--lab-fraction", type=float, default=0.3, help="share of courses with labs")
+    parser.add_argument("--exam-dates", type=int, default=10, help="days exams are spread over")
+    parser.add_argument("--exam-clustering", type=float, default=0.2, help="share of exams on one common slot")
+    parser.add_argument("--faculty", type=int, default=80)
+    parser.add_argument("--internal-conflicts", type=float, default=0.01, help="share of lab sections clashing with themselves")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+    sections = generate_sections(
+        courses=args.courses, sections_per_course=args.sections, lab_fraction=args.lab_fraction,
+        exam_dates=args.exam_dates, exam_clustering=args.exam_clustering, faculty=args.faculty,
+        internal_conflicts=args.internal_conflicts, seed=args.seed,
+    )
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(sections, f)
+    else:
+        json.dump(sections, sys.stdout)
+    print(f"{len(sections)} sections", file=sys.stderr)
+
+if __name__ == "__main__":
+    main()
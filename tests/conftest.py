@@ -0,0 +1,40 @@
+"""Test setup: usis.py serves a small synthetic feed from tests/data, offline.
+
+tests/data/connect.json is synthetic_data.generate_sections(courses=40, seed=1).
+"""
+import json
+import os
+import sys
+import tempfile
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+FEED_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "connect.json")
+os.environ["USIS_DATA_PATH"] = FEED_PATH
+os.environ["USIS_SNAPSHOT_PATH"] = os.path.join(tempfile.mkdtemp(prefix="usis-tests-"), "none.snapshot")
+os.environ.pop("USIS_SHARED_STORE_DIR", None)
+os.environ.setdefault("USIS_LOG_LEVEL", "WARNING")
+
+import usis  # noqa: E402
+
+@pytest.fixture
+def sections():
+    """A fresh copy of the synthetic feed (list of section dicts)."""
+    with open(FEED_PATH) as f:
+        return json.load(f)
+
+@pytest.fixture
+def dataset(sections):
+    return usis.build_dataset(sections, 1, "test")
+
+@pytest.fixture(scope="session")
+def app():
+    return usis.create_app()
+
+@pytest.fixture
+def client(app):
+    usis.current_dataset()
+    return app.test_client()
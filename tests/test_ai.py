@@ -0,0 +1,115 @@
+import json
+import threading
+
+import pytest
+
+import usis
+
+class BlockingClient(usis.LLMClient):
+    """Answers (in `chunks`) only once `release` is set."""
+
+    model_name = "blocking"
+
+    def __init__(self, chunks=("Hel", "lo")):
+        self.chunks = chunks
+        self.release = threading.Event()
+        self.calls = 0
+
+    def generate(self, prompt):
+        self.calls += 1
+        self.release.wait(10)
+        return "".join(self.chunks)
+
+    def stream(self, prompt):
+        self.release.wait(10)
+        for chunk in self.chunks:
+            if isinstance(chunk, Exception):
+                raise chunk
+            yield chunk
+
+@pytest.fixture
+def llm():
+    """Install a BlockingClient; it is released when the test ends."""
+    previous = usis.llm_client
+    client = BlockingClient()
+    usis.set_llm_client(client)
+    yield client
+    client.release.set()
+    usis.set_llm_client(previous)
+
+def sse_events(response):
+    events = []
+    for block in response.get_data(as_text=True).strip().split("\n\n"):
+        lines = dict(line.split(": ", 1) for line in block.splitlines())
+        events.append((lines.get("event"), json.loads(lines["data"])))
+    return events
+
+@pytest.fixture
+def unconfigured_gemini():
+    previous = usis.llm_client
+    usis.set_llm_client(usis.GeminiClient(api_key=None))
+    yield
+    usis.set_llm_client(previous)
+
+def test_missing_api_key_is_unavailable(unconfigured_gemini):
+    with pytest.raises(usis.AIUnavailable):
+        usis.generate_ai_text("prompt")
+
+def test_missing_api_key_answers_503(client, unconfigured_gemini):
+    routine = [usis.section_routine_view(section) for section in usis.current_dataset().sections[:2]]
+    response = client.post("/api/check_time_conflicts_ai", json={"routine": routine})
+    assert response.status_code == 503
+
+def test_llm_clients_must_implement_generate():
+    class Incomplete(usis.LLMClient):
+        pass
+
+    with pytest.raises(TypeError):
+        Incomplete()
+
+def test_slow_answer_times_out(llm, client, monkeypatch):
+    with pytest.raises(usis.AITimeout):
+        usis.generate_ai_text("slow", timeout=0.1)
+    monkeypatch.setattr(usis, "AI_TIMEOUT", 0.1)
+    assert client.post("/api/ask_ai", json={"question": "slow?"}).status_code == 504
+    assert client.post("/api/ask_ai", json={"question": "slow?", "stream": True}).status_code == 504
+
+def test_busy_executor_answers_503(llm, client, monkeypatch):
+    monkeypatch.setattr(usis, "_ai_slots", threading.BoundedSemaphore(1))
+    usis._ai_slots.acquire()
+    try:
+        response = client.post("/api/ask_ai", json={"question": "busy?"})
+        assert response.status_code == 503
+        assert client.post("/api/ask_ai", json={"question": "busy?", "stream": True}).status_code == 503
+    finally:
+        usis._ai_slots.release()
+
+def test_identical_prompts_share_one_call(llm):
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(usis.generate_ai_text("same", timeout=5))) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    llm.release.set()
+    for thread in threads:
+        thread.join()
+    assert results == ["Hello"] * 4
+    assert llm.calls == 1
+
+def test_answer_streams_as_server_sent_events(llm, client):
+    llm.release.set()
+    response = client.post("/api/ask_ai", json={"question": "stream?", "stream": True})
+    assert response.status_code == 200
+    assert response.mimetype == "text/event-stream"
+    assert sse_events(response) == [(None, {"text": "Hel"}), (None, {"text": "lo"}), ("done", {"answer": "Hello"})]
+    # The completed answer is cached and then sent in one piece
+    response = client.post("/api/ask_ai", json={"question": "stream?", "stream": True})
+    assert sse_events(response) == [(None, {"text": "Hello"}), ("done", {"answer": "Hello"})]
+
+def test_interrupted_stream_ends_with_an_error_event(llm, client):
+    llm.chunks = ("Hel", RuntimeError("connection reset"))
+    llm.release.set()
+    response = client.post("/api/ask_ai", json={"question": "interrupted?", "stream": True})
+    assert response.status_code == 200
+    events = sse_events(response)
+    assert events[0] == (None, {"text": "Hel"})
+    assert events[-1][0] == "error"
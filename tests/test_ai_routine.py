@@ -0,0 +1,82 @@
+import json
+
+import pytest
+
+import usis
+
+COURSES = ["CSE101", "EEE101", "MAT101"]
+
+def routine_request(courses=COURSES):
+    return {"courses": [{"course": code, "faculty": []} for code in courses], "days": usis.WEEKDAYS,
+            "times": usis.TIME_SLOTS, "useAI": True}
+
+def fits_window(section, ranges):
+    """Whether every kind of meeting of `section` touches one of the selected time ranges."""
+    def touches(records):
+        return any(usis.schedules_overlap(r.start, r.end, start, end) for r in records for start, end in ranges)
+    return touches(section.classes) and (not section.labs or touches(section.labs))
+
+def candidates(dataset, courses=COURSES):
+    ranges = [usis.parse_time_range(slot) for slot in usis.TIME_SLOTS]
+    return {
+        code: [s for s in dataset.sections_for_course(code)
+               if not usis.has_internal_conflicts(s) and fits_window(s, ranges)]
+        for code in courses
+    }
+
+def sections_conflict(section1, section2):
+    return bool(section1.mask & section2.mask or usis.check_exam_conflicts(section1, section2))
+
+@pytest.fixture
+def answer():
+    """Set the fake LLM's answer to a routine request."""
+    previous = usis.llm_client
+
+    def set_answer(text):
+        usis.set_llm_client(usis.FakeLLMClient(text))
+
+    yield set_answer
+    usis.set_llm_client(previous)
+
+def picked_ids(payload):
+    return [str(section["sectionId"]) for section in payload["routine"]]
+
+def test_valid_answer_is_returned_as_is(client, answer):
+    dataset = usis.current_dataset()
+    routines = usis.solve_routine(candidates(dataset), max_solutions=10)["routines"]
+    # Not the solver's first choice, so the answer can only come from the AI
+    chosen = [routines[-1][code].section_id for code in COURSES]
+    answer(json.dumps(chosen))
+    payload, status = usis.generate_routine(routine_request(), dataset)
+    assert status == 200
+    assert picked_ids(payload) == chosen
+    assert "aiIssues" not in payload
+
+def test_clashing_pick_is_repaired_keeping_the_others(client, answer):
+    dataset = usis.current_dataset()
+    domains = candidates(dataset)
+    for routine in usis.solve_routine(domains, max_solutions=1000)["routines"]:
+        first, second = routine[COURSES[0]], routine[COURSES[1]]
+        clashing = next((s for s in domains[COURSES[2]] if sections_conflict(s, first)), None)
+        if clashing is not None:
+            break
+    else:
+        pytest.skip("no clashing candidate in this feed")
+    answer(json.dumps([first.section_id, second.section_id, clashing.section_id]))
+    payload, status = usis.generate_routine(routine_request(), dataset)
+    assert status == 200
+    assert payload["aiIssues"]
+    ids = picked_ids(payload)
+    assert ids[:2] == [first.section_id, second.section_id]
+    assert ids[2] != clashing.section_id
+    repaired = [dataset.find_section_by_id(section_id) for section_id in ids]
+    assert usis.validate_routine(repaired, domains) == []
+
+def test_unparseable_answer_falls_back_to_the_solver(client, answer):
+    dataset = usis.current_dataset()
+    answer("Sorry, I can't help with that.")
+    payload, status = usis.generate_routine(routine_request(), dataset)
+    assert status == 200
+    assert payload["aiIssues"]
+    solved, _ = usis.generate_routine({**routine_request(), "useAI": False}, dataset)
+    assert payload["routine"] == solved["routine"]
@@ -0,0 +1,62 @@
+import multiprocessing
+import time
+from dataclasses import replace
+
+import pytest
+
+import usis
+
+pytestmark = pytest.mark.skipif("fork" not in multiprocessing.get_all_start_methods(), reason="needs fork")
+
+_versions = iter(range(1000, 10 ** 6))
+
+@pytest.fixture
+def batch_dataset(dataset, monkeypatch):
+    # A structure version no pool was created for yet
+    monkeypatch.setattr(usis, "BATCH_WORKERS", 2)
+    usis.routine_cache.clear()
+    return replace(dataset, version=next(_versions))
+
+def routine_requests(dataset, count):
+    courses = list(dataset.index["courses"])
+    return [
+        {"id": i, "courses": [{"course": courses[i % len(courses)], "faculty": []}], "days": usis.WEEKDAYS, "times": usis.TIME_SLOTS}
+        for i in range(count)
+    ]
+
+def test_batch_matches_single_requests(batch_dataset):
+    reqs = routine_requests(batch_dataset, 6)
+    results = sorted(usis.run_routine_batch(reqs, batch_dataset), key=lambda result: result["index"])
+    for req, result in zip(reqs, results):
+        payload, status = usis.generate_routine(req, batch_dataset)
+        assert result["status"] == status
+        assert result["routine"] == payload["routine"]
+
+def test_workers_forked_while_a_lock_is_held(batch_dataset, monkeypatch):
+    monkeypatch.setattr(usis, "BATCH_STALL_TIMEOUT", 20)
+    # Every worker records solver metrics; the lock held here at fork time
+    # must not stay held in the children
+    with usis.SOLVER_RUNS._lock:
+        results = list(usis.run_routine_batch(routine_requests(batch_dataset, 4), batch_dataset))
+    assert [result["status"] for result in results] == [200] * 4
+
+def test_seat_update_keeps_pool(batch_dataset):
+    pool = usis.batch_pool(batch_dataset)
+    seats = dict(batch_dataset.seats)
+    section_id = next(iter(seats))
+    seats[section_id] = (seats[section_id][0], 0)
+    updated = replace(batch_dataset, seats=seats, seat_version=batch_dataset.seat_version + 1)
+    assert usis.batch_pool(updated) is pool
+    assert usis.batch_pool(replace(batch_dataset, version=next(_versions))) is not pool
+
+def stuck_solve(req):
+    time.sleep(60)
+
+def test_stalled_batch_fails_instead_of_hanging(batch_dataset, monkeypatch):
+    monkeypatch.setattr(usis, "BATCH_STALL_TIMEOUT", 0.5)
+    monkeypatch.setattr(usis, "solve_batch_request", stuck_solve)
+    started = time.monotonic()
+    results = list(usis.run_routine_batch(routine_requests(batch_dataset, 3), batch_dataset))
+    assert time.monotonic() - started < 10
+    assert [result["status"] for result in results] == [504] * 3
+    assert usis._batch_pool is None
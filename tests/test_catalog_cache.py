@@ -0,0 +1,26 @@
+from dataclasses import replace
+
+import usis
+
+def test_unread_query_args_share_an_entry(client):
+    usis.catalog_cache.clear()
+    for i in range(5):
+        assert client.get(f"/api/courses?_={i}").status_code == 200
+        assert client.get(f"/api/faculty?cachebust={i}").status_code == 200
+    assert len(usis.catalog_cache) == 2
+    assert client.get("/api/faculty_for_courses?courses=CSE101").status_code == 200
+    assert client.get("/api/faculty_for_courses?courses=CSE102").status_code == 200
+    assert len(usis.catalog_cache) == 4
+
+def test_seat_only_swap_keeps_entries(client):
+    dataset = usis.current_dataset()
+    usis.catalog_cache.clear()
+    client.get("/api/courses")
+    usis.clear_catalog_cache(replace(dataset, seat_version=dataset.seat_version + 1))
+    assert len(usis.catalog_cache) == 1
+    usis.clear_catalog_cache(replace(dataset, version=dataset.version + 1))
+    assert len(usis.catalog_cache) == 0
+    usis.clear_catalog_cache(dataset)
+
+def test_cache_is_bounded_in_bytes():
+    assert usis.catalog_cache.max_bytes == usis.CATALOG_CACHE_MAX_BYTES
@@ -0,0 +1,42 @@
+import pytest
+
+import usis
+
+def test_section_ids_are_capped(client):
+    ids = [section.section_id for section in usis.current_dataset().sections]
+    allowed = ",".join(ids[:usis.CONFLICTS_MAX_SECTION_IDS])
+    assert client.get(f"/api/conflicts?sectionIds={allowed}").status_code == 200
+    too_many = ",".join(ids[:usis.CONFLICTS_MAX_SECTION_IDS + 1])
+    response = client.get(f"/api/conflicts?sectionIds={too_many}")
+    assert response.status_code == 400
+    assert "error" in response.get_json()
+
+def test_conflict_matrix_matches_pairwise_checks(dataset):
+    matrix = dataset.conflicts
+    if matrix is None:
+        pytest.skip("needs NumPy")
+    sections = dataset.sections
+    for a in sections:
+        time_clashes, exam_clashes = set(), set()
+        for b in sections:
+            time_clash = bool(a.mask & b.mask)
+            exam_clash = bool(usis.check_exam_conflicts(a, b))
+            assert matrix.time_conflict(a, b) == time_clash
+            assert matrix.exam_conflict(a, b) == exam_clash
+            assert matrix.conflict(a, b) == usis.sections_conflict(a, b)
+            if b is not a:
+                if time_clash:
+                    time_clashes.add(b.section_id)
+                if exam_clash:
+                    exam_clashes.add(b.section_id)
+        assert {s.section_id for s in matrix.conflicting(a, "time")} == time_clashes
+        assert {s.section_id for s in matrix.conflicting(a, "exam")} == exam_clashes
+
+def test_exam_index_matches_pairwise_checks(dataset):
+    sections = dataset.sections
+    for a in sections:
+        for b in sections:
+            if b is not a:  # a section's own exams aren't indexed against it
+                assert dataset.exams.exam_conflict(a, b) == bool(usis.check_exam_conflicts(a, b))
+    pairwise = [entry for i, a in enumerate(sections) for b in sections[i + 1:] for entry in usis.check_exam_conflicts(a, b)]
+    assert sorted(map(repr, dataset.exams.all_conflicts())) == sorted(map(repr, pairwise))
@@ -0,0 +1,76 @@
+import json
+import os
+import sys
+import types
+
+import pytest
+
+import usis
+
+class FakeResponse:
+    def __init__(self, status_code, content=b"", headers=None):
+        self.status_code = status_code
+        self.content = content
+        self.headers = headers or {}
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise RuntimeError(f"HTTP {self.status_code}")
+
+def fake_feed_server(monkeypatch, bodies):
+    """Serve `bodies` in turn with ETag "v1", answering 304 to a matching If-None-Match."""
+    calls = []
+
+    def get(url, headers=None, timeout=None):
+        calls.append(dict(headers or {}))
+        if (headers or {}).get("If-None-Match") == "v1":
+            return FakeResponse(304)
+        return FakeResponse(200, bodies[min(len(calls), len(bodies)) - 1], {"ETag": "v1"})
+
+    monkeypatch.setitem(sys.modules, "requests", types.SimpleNamespace(get=get))
+    return calls
+
+def manual_manager(**kwargs):
+    """A DatasetManager that is only refreshed by the test, without the background thread."""
+    manager = usis.DatasetManager(snapshot_path=None, store_dir=None, **kwargs)
+    manager._pid = os.getpid()  # what start() checks before starting the thread
+    return manager
+
+def test_failed_load_is_fetched_again_in_full(monkeypatch, sections):
+    body = json.dumps(sections).encode()
+    calls = fake_feed_server(monkeypatch, [body[:len(body) // 2], body])
+    manager = manual_manager(url="http://feed.invalid/connect.json", path=None)
+    with pytest.raises(ValueError):
+        manager.refresh()
+    assert manager.refresh() is True
+    assert "If-None-Match" not in calls[1]
+    assert len(manager.current(timeout=0).sections) == len(sections)
+    # Once loaded, the ETag is used
+    assert manager.refresh() is False
+    assert calls[2]["If-None-Match"] == "v1"
+
+def test_local_feed_retried_after_failed_load(tmp_path, sections):
+    path = tmp_path / "connect.json"
+    path.write_text("[{")
+    manager = manual_manager(path=str(path))
+    with pytest.raises(ValueError):
+        manager.refresh()
+    # Still retried although the file hasn't changed since
+    with pytest.raises(ValueError):
+        manager.refresh()
+
+def test_seat_only_change_keeps_sections(tmp_path, sections):
+    path = tmp_path / "connect.json"
+    path.write_text(json.dumps(sections))
+    manager = manual_manager(path=str(path))
+    assert manager.refresh() is True
+    first = manager.current(timeout=0)
+    sections[0]["consumedSeat"] = sections[0]["capacity"]
+    path.write_text(json.dumps(sections))
+    # mtime resolution can hide the rewrite
+    manager._mtime = None
+    assert manager.refresh() is True
+    second = manager.current(timeout=0)
+    assert second.sections is first.sections
+    assert second.version == first.version and second.seat_version == first.seat_version + 1
+    assert second.seats[str(sections[0]["sectionId"])] == (sections[0]["capacity"], sections[0]["capacity"])
@@ -0,0 +1,40 @@
+import os
+import subprocess
+import sys
+import threading
+
+import usis
+
+def test_concurrent_lazy_import_waits_for_module(tmp_path, monkeypatch):
+    # A module that is slow to import sits half-initialised in sys.modules;
+    # other threads must get it only once the import has finished
+    (tmp_path / "usis_slow_module.py").write_text("import time\ntime.sleep(0.3)\nVALUE = 42\n")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    results = []
+    errors = []
+
+    def use():
+        try:
+            results.append(usis.lazy_import("usis_slow_module").VALUE)
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=use) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert errors == []
+    assert results == [42] * 8
+    assert "usis_slow_module" in usis.import_seconds
+
+def test_lazy_import_times_only_first_import():
+    usis.lazy_import("json")
+    assert "json" not in usis.import_seconds
+
+def test_import_starts_nothing():
+    # Only create_app() starts the dataset refresh thread
+    code = "import threading, usis; print(threading.active_count(), usis.datasets._dataset)"
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True,
+                            cwd=os.path.dirname(usis.__file__), env=os.environ)
+    assert result.stdout.split() == ["1", "None"]
@@ -0,0 +1,49 @@
+import multiprocessing
+import time
+from dataclasses import replace
+
+import pytest
+
+import usis
+
+pytestmark = pytest.mark.skipif("fork" not in multiprocessing.get_all_start_methods(), reason="needs fork")
+
+_versions = iter(range(2000, 10 ** 6))
+
+@pytest.fixture
+def solver_dataset(dataset):
+    # A structure version no pool was created for yet
+    return replace(dataset, version=next(_versions))
+
+def candidates(dataset, count):
+    courses = sorted(dataset.index["courses"], key=lambda code: -len(dataset.sections_for_course(code)))[:count]
+    return {code: [s for s in dataset.sections_for_course(code) if not usis.has_internal_conflicts(s)] for code in courses}
+
+def routine_ids(result):
+    return sorted(tuple(sorted(s.section_id for s in routine.values())) for routine in result["routines"])
+
+def test_parallel_matches_sequential(solver_dataset):
+    domains = candidates(solver_dataset, 3)
+    sequential = usis.solve_routine(domains, 10 ** 6)
+    parallel = usis.solve_routine_parallel(domains, solver_dataset, 10 ** 6)
+    assert parallel["complete"] and sequential["complete"]
+    assert routine_ids(parallel) == routine_ids(sequential)
+
+def test_not_queued_behind_batches(solver_dataset, monkeypatch):
+    monkeypatch.setattr(usis, "BATCH_WORKERS", 1)
+    busy = usis.batch_pool(solver_dataset).submit(time.sleep, 5)
+    try:
+        started = time.monotonic()
+        result = usis.solve_routine_parallel(candidates(solver_dataset, 3), solver_dataset, 1, time_budget=3)
+        assert result["routines"]
+        assert time.monotonic() - started < 3
+    finally:
+        busy.cancel()
+
+def test_expired_deadline_returns_incomplete(solver_dataset, monkeypatch):
+    monkeypatch.setattr(usis, "SOLVER_PARALLEL_GRACE", 0.1)
+    started = time.monotonic()
+    result = usis.solve_routine_parallel(candidates(solver_dataset, 3), solver_dataset, 10 ** 6, time_budget=0)
+    assert time.monotonic() - started < 2
+    assert not result["complete"]
+    assert result["routines"] == []
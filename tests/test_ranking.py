@@ -0,0 +1,50 @@
+import itertools
+import random
+
+import pytest
+
+import usis
+
+def sections_conflict(section1, section2):
+    """Pairwise class, lab and exam clash check, independent of the solver's bookkeeping."""
+    return any(
+        record1.day == record2.day and usis.schedules_overlap(record1.start, record1.end, record2.start, record2.end)
+        for record1 in section1.classes + section1.labs
+        for record2 in section2.classes + section2.labs
+    ) or any(usis.exam_schedules_overlap(exam1, exam2) for exam1 in section1.exams for exam2 in section2.exams)
+
+def brute_force_costs(candidates_per_course, commute_preference, preferred_faculty):
+    """Costs of every conflict-free routine, cheapest first."""
+    costs = []
+    for combo in itertools.product(*candidates_per_course.values()):
+        if not any(sections_conflict(a, b) for a, b in itertools.combinations(combo, 2)):
+            costs.append(usis.score_routine(list(combo), commute_preference, preferred_faculty)["cost"])
+    return sorted(costs)
+
+@pytest.mark.parametrize("commute_preference", ["", "far", "near"])
+@pytest.mark.parametrize("k", [1, 5])
+def test_top_k_matches_brute_force(dataset, commute_preference, k):
+    rng = random.Random(k)
+    courses = list(dataset.index["courses"])
+    for _ in range(6):
+        candidates = {code: list(dataset.sections_for_course(code)) for code in rng.sample(courses, 3)}
+        course = next(iter(candidates))
+        preferred_faculty = {course.upper(): {candidates[course][0].faculty.upper()}}
+        result = usis.rank_routines(candidates, k, commute_preference, preferred_faculty)
+        assert result["complete"]
+        expected = brute_force_costs(candidates, commute_preference, preferred_faculty)[:k]
+        assert [score["cost"] for score, _ in result["routines"]] == expected
+        for score, routine in result["routines"]:
+            sections = list(routine.values())
+            assert not any(sections_conflict(a, b) for a, b in itertools.combinations(sections, 2))
+            assert usis.score_routine(sections, commute_preference, preferred_faculty) == score
+
+def test_invalid_top_k_is_a_bad_request(client):
+    code = next(iter(usis.current_dataset().index["courses"]))
+    body = {"courses": [{"course": code, "faculty": []}], "days": usis.WEEKDAYS, "times": usis.TIME_SLOTS}
+    for value in ("x", "2.5", {"k": 1}):
+        response = client.post("/api/routine", json={**body, "topK": value})
+        assert response.status_code == 400
+        assert "topK" in response.get_json()["error"]
+    response = client.post("/api/routine", json={**body, "topK": "3"})
+    assert response.status_code == 200 and len(response.get_json()["routines"]) <= 3
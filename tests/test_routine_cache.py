@@ -0,0 +1,34 @@
+import usis
+
+def routine_body(courses):
+    return {"courses": [{"course": code, "faculty": []} for code in courses], "days": usis.WEEKDAYS, "times": usis.TIME_SLOTS}
+
+def uncached(client, body):
+    usis.routine_cache.clear()
+    return client.post("/api/routine", json=body).get_json()
+
+def test_cached_answers_match_uncached_ones(client):
+    courses = ["CSE101", "EEE101", "MAT101"]
+    variants = [courses, courses[::-1], [code.lower() for code in courses], ["cse101", "NOPE101"], ["NOPE101"]]
+    expected = [uncached(client, routine_body(variant)) for variant in variants]
+    usis.routine_cache.clear()
+    for variant, answer in zip(variants, expected):
+        assert client.post("/api/routine", json=routine_body(variant)).get_json() == answer
+    # Now every answer comes from the cache
+    for variant, answer in zip(variants, expected):
+        assert client.post("/api/routine", json=routine_body(variant)).get_json() == answer
+    assert expected[0]["routine"] != expected[1]["routine"]
+
+def test_batch_results_keep_request_order(client):
+    courses = ["CSE101", "EEE101", "MAT101"]
+    backward = uncached(client, routine_body(courses[::-1]))
+    usis.routine_cache.clear()
+    dataset = usis.current_dataset()
+    list(usis.run_routine_batch([routine_body(courses)], dataset))
+    [result] = usis.run_routine_batch([routine_body(courses[::-1])], dataset)
+    assert result["routine"] == backward["routine"]
+
+def test_unhashable_options_skip_the_cache(client):
+    # An empty maxRoutines means none, so this request is otherwise fine
+    response = client.post("/api/routine", json={**routine_body(["CSE101"]), "maxRoutines": []})
+    assert response.status_code == 200
@@ -0,0 +1,35 @@
+import json
+
+import usis
+
+def test_deltas_update_seats(client):
+    section = usis.current_dataset().sections[0]
+    capacity, consumed = usis.current_dataset().seats[section.section_id]
+    try:
+        assert usis.datasets.apply_seat_deltas(usis.parse_seat_deltas({section.section_id: {"capacity": capacity + 5, "consumedSeat": 1}})) == 1
+        seats = client.get(f"/api/seats?sectionIds={section.section_id},nope").get_json()
+        assert seats == {section.section_id: {"capacity": capacity + 5, "consumedSeat": 1, "availableSeats": capacity + 4}}
+        details = client.get(f"/api/course_details?course={section.course_code}").get_json()
+        assert next(d for d in details if str(d["sectionId"]) == section.section_id)["consumedSeat"] == 1
+    finally:
+        usis.datasets.apply_seat_deltas([(section.section_id, capacity, consumed)])
+
+def test_invalid_counts_are_skipped(tmp_path, client):
+    dataset = usis.current_dataset()
+    first, second = dataset.sections[0].section_id, dataset.sections[1].section_id
+    path = tmp_path / "seats.json"
+    path.write_text(json.dumps({first: "5", second: {"capacity": -1}, "unknown": 3}))
+    manager = usis.datasets
+    previous = manager.seat_delta_path
+    manager.seat_delta_path = str(path)
+    try:
+        assert manager.refresh_seats() == 0
+    finally:
+        manager.seat_delta_path = previous
+    assert usis.current_dataset().seats == dataset.seats
+    assert client.get(f"/api/seats?sectionIds={first}").status_code == 200
+    assert client.get(f"/api/course_details?course={dataset.sections[0].course_code}").status_code == 200
+
+def test_valid_seat_count():
+    assert usis.valid_seat_count(None) and usis.valid_seat_count(0) and usis.valid_seat_count(40)
+    assert not any(usis.valid_seat_count(value) for value in ("5", -1, 2.5, True))
@@ -0,0 +1,84 @@
+import json
+import random
+
+import pytest
+
+import usis
+
+FIELDS = ("section_id", "course_code", "course_name", "section_name", "faculty", "classes", "labs", "exams",
+          "mask", "lab_mask", "internal_conflict", "raw", "detail", "entries")
+
+@pytest.fixture
+def store(tmp_path, sections):
+    usis.patch_exam_dates(sections)
+    path = str(tmp_path / "usis.cols")
+    usis.write_section_store(path, sections, usis.structure_hash(sections))
+    return usis.SectionStore(path)
+
+@pytest.fixture
+def store_dataset(store):
+    return usis.build_store_dataset(store, 1, "test", store.seats())
+
+def test_round_trip(store, dataset):
+    assert store.size == len(dataset.sections)
+    assert store.seats() == dataset.seats
+    assert [section.raw for section in store.sections] == [section.raw for section in dataset.sections]
+
+def test_store_sections_match_sections(store_dataset, dataset):
+    for stored, section in zip(store_dataset.sections, dataset.sections):
+        assert isinstance(stored, usis.StoreSection)
+        for field in FIELDS:
+            assert getattr(stored, field) == getattr(section, field), field
+    assert store_dataset.index.keys() == dataset.index.keys()
+    assert list(store_dataset.index["courses"].items()) == list(dataset.index["courses"].items())
+
+def test_conflict_matrix_matches_in_memory_build(store_dataset, dataset):
+    if dataset.conflicts is None:
+        pytest.skip("needs NumPy")
+    for kind in ("time", "exam", "any"):
+        for stored, section in zip(store_dataset.sections, dataset.sections):
+            assert ([s.section_id for s in store_dataset.conflicts.conflicting(stored, kind)]
+                    == [s.section_id for s in dataset.conflicts.conflicting(section, kind)])
+
+def test_window_filter_matches_in_memory_build(store_dataset, dataset):
+    if dataset.windows is None:
+        pytest.skip("needs NumPy")
+    rng = random.Random(0)
+    for _ in range(50):
+        days = set(rng.sample(usis.WEEKDAYS, rng.randint(1, len(usis.WEEKDAYS))))
+        ranges = [usis.parse_time_range(slot) for slot in rng.sample(usis.TIME_SLOTS, rng.randint(1, len(usis.TIME_SLOTS)))]
+        assert (store_dataset.windows.fits(days, ranges) == dataset.windows.fits(days, ranges)).all()
+
+def test_routines_match_in_memory_build(store_dataset, dataset):
+    courses = list(dataset.index["courses"])[:3]
+    solved = [
+        usis.solve_routine({code: list(ds.sections_for_course(code)) for code in courses}, 10 ** 6, conflict=ds.sections_conflict)
+        for ds in (store_dataset, dataset)
+    ]
+    assert [[s.section_id for s in routine.values()] for routine in solved[0]["routines"]] == \
+        [[s.section_id for s in routine.values()] for routine in solved[1]["routines"]]
+
+def test_truncated_store_is_refused(store, tmp_path):
+    data = open(store.path, "rb").read()
+    for size in (len(data) // 2, usis.STORE_HEADER.size - 1):
+        path = tmp_path / f"truncated{size}.cols"
+        path.write_bytes(data[:size])
+        with pytest.raises(usis.StoreError):
+            usis.SectionStore(str(path))
+
+def test_wrong_magic_is_refused(store, tmp_path):
+    path = tmp_path / "other.cols"
+    path.write_bytes(b"NOTASTOR" + open(store.path, "rb").read()[8:])
+    with pytest.raises(usis.StoreError):
+        usis.SectionStore(str(path))
+
+def test_managers_share_the_store_file(tmp_path, sections):
+    feed = tmp_path / "connect.json"
+    feed.write_text(json.dumps(sections))
+    store_dir = tmp_path / "shm"
+    store_dir.mkdir()
+    first = usis.DatasetManager(path=str(feed), snapshot_path=None, store_dir=str(store_dir))
+    second = usis.DatasetManager(path=str(feed), snapshot_path=None, store_dir=str(store_dir))
+    assert first.refresh() and second.refresh()
+    assert len(list(store_dir.iterdir())) == 1
+    assert first._dataset.sections[0]._store.path == second._dataset.sections[0]._store.path
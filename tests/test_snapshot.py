@@ -0,0 +1,33 @@
+import os
+
+import pytest
+
+import usis
+
+def test_round_trip(tmp_path, dataset):
+    path = str(tmp_path / "usis.snapshot")
+    usis.write_snapshot(path, {"dataset": dataset, "content_hash": "abc"})
+    payload = usis.read_snapshot(path)
+    assert payload["content_hash"] == "abc"
+    loaded = payload["dataset"]
+    assert [s.section_id for s in loaded.sections] == [s.section_id for s in dataset.sections]
+    assert loaded.seats == dataset.seats
+
+class Exploit:
+    def __reduce__(self):
+        return (os.system, ("true",))
+
+def test_foreign_globals_are_refused(tmp_path):
+    path = str(tmp_path / "usis.snapshot")
+    usis.write_snapshot(path, {"dataset": Exploit()})
+    with pytest.raises(usis.SnapshotError):
+        usis.read_snapshot(path)
+
+def test_corrupt_body_is_refused(tmp_path, dataset):
+    path = tmp_path / "usis.snapshot"
+    usis.write_snapshot(str(path), {"dataset": dataset})
+    data = bytearray(path.read_bytes())
+    data[-1] ^= 0xFF
+    path.write_bytes(bytes(data))
+    with pytest.raises(usis.SnapshotError):
+        usis.read_snapshot(str(path))
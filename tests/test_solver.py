@@ -0,0 +1,62 @@
+import itertools
+import random
+
+import pytest
+
+import usis
+
+def sections_conflict(section1, section2):
+    """Pairwise class, lab and exam clash check, independent of the solver's bookkeeping."""
+    return any(
+        record1.day == record2.day and usis.schedules_overlap(record1.start, record1.end, record2.start, record2.end)
+        for record1 in section1.classes + section1.labs
+        for record2 in section2.classes + section2.labs
+    ) or any(usis.exam_schedules_overlap(exam1, exam2) for exam1 in section1.exams for exam2 in section2.exams)
+
+def brute_force(candidates_per_course, conflict=sections_conflict):
+    """Every conflict-free routine, as sorted tuples of section ids."""
+    routines = set()
+    for combo in itertools.product(*candidates_per_course.values()):
+        if not any(conflict(a, b) for a, b in itertools.combinations(combo, 2)):
+            routines.add(tuple(sorted(section.section_id for section in combo)))
+    return routines
+
+def routine_ids(routines):
+    return [tuple(sorted(section.section_id for section in routine.values())) for routine in routines]
+
+def course_samples(dataset, count, trials=8, seed=0):
+    rng = random.Random(seed)
+    courses = list(dataset.index["courses"])
+    for _ in range(trials):
+        yield {code: list(dataset.sections_for_course(code)) for code in rng.sample(courses, count)}
+
+@pytest.mark.parametrize("count", [2, 3, 4])
+def test_all_routines_match_brute_force(dataset, count):
+    for candidates in course_samples(dataset, count, seed=count):
+        result = usis.solve_routine(candidates, max_solutions=10 ** 6)
+        assert result["complete"]
+        found = routine_ids(result["routines"])
+        assert len(found) == len(set(found))
+        assert set(found) == brute_force(candidates)
+
+def test_conflict_matrix_gives_the_same_routines(dataset):
+    for candidates in course_samples(dataset, 3, seed=7):
+        plain = usis.solve_routine(candidates, max_solutions=10 ** 6)
+        matrix = usis.solve_routine(candidates, max_solutions=10 ** 6, conflict=dataset.sections_conflict)
+        assert set(routine_ids(matrix["routines"])) == set(routine_ids(plain["routines"]))
+
+def test_first_routine_exists_iff_brute_force_finds_one(dataset):
+    for candidates in course_samples(dataset, 4, trials=12, seed=11):
+        result = usis.solve_routine(candidates)
+        expected = brute_force(candidates)
+        assert bool(result["routines"]) == bool(expected)
+        assert set(routine_ids(result["routines"])) <= expected
+
+def test_invalid_max_routines_is_a_bad_request(client):
+    code = next(iter(usis.current_dataset().index["courses"]))
+    body = {"courses": [{"course": code, "faculty": []}], "days": usis.WEEKDAYS, "times": usis.TIME_SLOTS, "allRoutines": True}
+    for value in ("x", [3], {"n": 1}):
+        response = client.post("/api/routine", json={**body, "maxRoutines": value})
+        assert response.status_code == 400
+        assert "maxRoutines" in response.get_json()["error"]
+    assert client.post("/api/routine", json={**body, "maxRoutines": "2"}).status_code == 200
@@ -0,0 +1,51 @@
+import random
+
+import pytest
+
+import usis
+
+IRREGULAR_DAY = "ONLINE"  # not in WEEKDAYS, so it has no mask bits
+
+@pytest.fixture
+def window_dataset(sections):
+    if usis.optional_import("numpy") is None:
+        pytest.skip("needs NumPy")
+    # A few sections meeting on a day outside WEEKDAYS take the per-section path
+    for raw in sections[::17]:
+        raw["sectionSchedule"]["classSchedules"][0]["day"] = IRREGULAR_DAY
+    for raw in sections[5::23]:
+        for lab in raw["labSchedules"]:
+            lab["day"] = IRREGULAR_DAY
+    return usis.build_dataset(sections, 1, "test")
+
+def expected(dataset, days, ranges):
+    return [
+        section.section_id for section in dataset.sections
+        if not usis.has_internal_conflicts(section) and usis.section_fits_window(section, days, ranges)
+    ]
+
+def test_random_windows_match_section_fits_window(window_dataset):
+    rng = random.Random(0)
+    days_offered = usis.WEEKDAYS + [IRREGULAR_DAY]
+    for _ in range(200):
+        days = set(rng.sample(days_offered, rng.randint(0, len(days_offered))))
+        ranges = [usis.parse_time_range(slot) for slot in rng.sample(usis.TIME_SLOTS, rng.randint(0, len(usis.TIME_SLOTS)))]
+        fits = window_dataset.windows.fits(days, ranges)
+        selected = window_dataset.windows.select(window_dataset.sections, fits)
+        assert [section.section_id for section in selected] == expected(window_dataset, days, ranges)
+
+def test_irregular_sections_are_checked_one_by_one(window_dataset):
+    days, ranges = {IRREGULAR_DAY}, [usis.parse_time_range(slot) for slot in usis.TIME_SLOTS]
+    selected = window_dataset.windows.select(window_dataset.sections, window_dataset.windows.fits(days, ranges))
+    assert selected
+    assert [section.section_id for section in selected] == expected(window_dataset, days, ranges)
+
+def test_off_grid_window_falls_back(window_dataset, client):
+    ranges = [(8 * 60 + 5, 9 * 60 + 20)]
+    assert usis.window_mask(set(usis.WEEKDAYS), ranges) is None
+    assert window_dataset.windows.fits(set(usis.WEEKDAYS), ranges) is None
+    # /api/routine then filters section by section
+    course = usis.current_dataset().sections[0].course_code
+    body = {"courses": [{"course": course, "faculty": []}], "days": usis.WEEKDAYS, "times": ["8:05 AM-9:20 AM"]}
+    response = client.post("/api/routine", json=body)
+    assert response.status_code == 200
@@ -0,0 +1,4 @@
+"""WSGI entry point for gunicorn (wsgi:app) and Vercel."""
+from usis import create_app
+
+app = create_app()